@@ -1,20 +1,86 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin.utils import model_ngettext
 from django.contrib.auth.admin import User
 from .models import Person, Logger
 
 
+@admin.action(permissions=["delete"], description="Delete selected %(verbose_name_plural)s (no confirmation)")
+def bulk_delete_fast(modeladmin, request, queryset):
+    # Unlike delete_selected, skips the confirmation page that collects
+    # every related object. Person and Logger have no relations or delete
+    # receivers, so queryset.delete() issues a single DELETE ... WHERE.
+    modeladmin.log_deletions(request, queryset)
+    deleted, _ = queryset.delete()
+    modeladmin.message_user(
+        request,
+        "Successfully deleted %(count)d %(items)s."
+        % {"count": deleted, "items": model_ngettext(modeladmin.opts, deleted)},
+        messages.SUCCESS,
+    )
+
+
 # Register your models here.
-admin.site.register(Person)
-admin.site.register(Logger)
+@admin.register(Person)
+class PersonAdmin(admin.ModelAdmin):
+    list_display = ("person_name", "email", "phone")
+    actions = [bulk_delete_fast]
+    list_select_related = True
+    list_per_page = 50
+
+
+@admin.register(Logger)
+class LoggerAdmin(admin.ModelAdmin):
+    list_display = ("full_name", "time_log")
+    ordering = ("full_name",)
+    # icontains (LIKE '%x%'), which can't use logger_full_name_idx
+    search_fields = ("full_name",)
+    actions = [bulk_delete_fast]
+    list_select_related = True
+    list_per_page = 50
 
 admin.site.unregister(User)
 
 
 from django.contrib.auth.admin import UserAdmin
 
+
+def _freeze_kwargs(kwargs):
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in kwargs.items()
+    ))
+
+
 @admin.register(User) 
 class NewAdmin(UserAdmin): 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The add form doesn't depend on the object, so build it once per
+        # (is_superuser, kwargs) combination instead of on every request.
+        # Its fields (username/password) have no related-object widgets, so
+        # nothing else in it depends on the requesting user's permissions.
+        self._add_form_cache = {}
+
     def get_form(self, request, obj=None, **kwargs): 
+        if obj is not None:
+            return self._build_form(request, obj, **kwargs)
+        key = (request.user.is_superuser, _freeze_kwargs(kwargs))
+        try:
+            form = self._add_form_cache.get(key)
+        except TypeError:
+            # unhashable kwargs (e.g. a widgets dict), skip the cache
+            return self._build_form(request, obj, **kwargs)
+        if form is None:
+            form = self._build_form(request, obj, **kwargs)
+            # ModelAdmin.get_form binds formfield_callback to this request.
+            # The fields are already built, so drop it rather than keep the
+            # request alive in the cache.
+            form.Meta.formfield_callback = None
+            form._meta.formfield_callback = None
+            self._add_form_cache[key] = form
+        return form
+
+    def _build_form(self, request, obj=None, **kwargs):
         form = super().get_form(request, obj, **kwargs) 
         is_superuser = request.user.is_superuser 
 
@@ -1,5 +1,5 @@
 from django import forms
-from .models import Logger
+from .models import Employee, Logger
 
 SHIFTS = (
     ("1", "Morning"),
@@ -16,3 +16,8 @@ class LogForm(forms.ModelForm):
     class Meta:
         model = Logger
         fields = "__all__"
+
+class EmployeeForm(forms.ModelForm):
+    class Meta:
+        model = Employee
+        fields = ["name", "email", "contact"]
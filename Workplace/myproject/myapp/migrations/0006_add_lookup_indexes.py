@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0005_employee_employee_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['person_name'], name='person_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logger',
+            index=models.Index(fields=['time_log'], name='logger_time_log_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['email'], name='employee_email_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0006_add_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logger',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=401)),
+        ),
+        migrations.AddIndex(
+            model_name='logger',
+            index=models.Index(fields=['full_name'], name='logger_full_name_idx'),
+        ),
+    ]
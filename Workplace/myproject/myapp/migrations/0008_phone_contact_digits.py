@@ -0,0 +1,30 @@
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0007_logger_full_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='person',
+            name='phone',
+            field=models.CharField(max_length=10, validators=[django.core.validators.RegexValidator('^[0-9]{10}$', 'Enter a 10-digit phone number.')]),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='contact',
+            field=models.CharField(max_length=15, validators=[django.core.validators.RegexValidator('^[0-9]{1,15}$', 'Enter a contact number of up to 15 digits.')]),
+        ),
+        migrations.AddConstraint(
+            model_name='person',
+            constraint=models.CheckConstraint(condition=models.Q(('phone__regex', '^[0-9]{10}$')), name='phone_10digits', violation_error_code='invalid_phone', violation_error_message='Phone must be exactly 10 digits.'),
+        ),
+        migrations.AddConstraint(
+            model_name='employee',
+            constraint=models.CheckConstraint(condition=models.Q(('contact__regex', '^[0-9]{1,15}$')), name='employee_contact_15digits', violation_error_code='invalid_contact', violation_error_message='Contact must be 1 to 15 digits.'),
+        ),
+    ]
@@ -1,11 +1,31 @@
+from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models import Q, Value
+from django.db.models.functions import Concat
 
 # Create your models here.
 class Person(models.Model):
     person_name = models.CharField(max_length=20)
     age = models.IntegerField()
     email = models.EmailField()
-    phone = models.CharField(max_length=10)
+    # Kept as text so leading zeros survive, but digits only
+    phone = models.CharField(
+        max_length=10,
+        validators=[RegexValidator(r"^[0-9]{10}$", "Enter a 10-digit phone number.")],
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["person_name"], name="person_name_idx"),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(phone__regex=r"^[0-9]{10}$"),
+                name="phone_10digits",
+                violation_error_code="invalid_phone",
+                violation_error_message="Phone must be exactly 10 digits.",
+            ),
+        ]
 
     def __str__(self):
         return self.person_name
@@ -15,14 +35,50 @@ class Logger(models.Model):
     first_name = models.CharField(max_length=200)
     last_name = models.CharField(max_length=200)
     time_log = models.TimeField(help_text="Enter the Exact Time")
+    # Stored by the database so sorting by name uses one index
+    full_name = models.GeneratedField(
+        expression=Concat("first_name", Value(" "), "last_name"),
+        output_field=models.CharField(max_length=401),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["full_name"], name="logger_full_name_idx"),
+            models.Index(fields=["time_log"], name="logger_time_log_idx"),
+        ]
 
     def __str__(self):
-        return self.first_name
+        # full_name is only available once the row has been read from the db
+        if "full_name" in self.__dict__:
+            return self.full_name
+        return f"{self.first_name} {self.last_name}"
+
+    @classmethod
+    def bulk_log(cls, rows):
+        # One INSERT per 1000 rows instead of one per row
+        return cls.objects.bulk_create([cls(**row) for row in rows], batch_size=1000)
     
 class Employee(models.Model):   
     name = models.CharField(max_length=100)   
     email = models.EmailField()   
-    contact = models.CharField(max_length=15)   
+    # Kept as text so leading zeros survive, but digits only
+    contact = models.CharField(
+        max_length=15,
+        validators=[RegexValidator(r"^[0-9]{1,15}$", "Enter a contact number of up to 15 digits.")],
+    )
     class Meta:   
         db_table = "Employee" 
+        indexes = [
+            models.Index(fields=["name"], name="employee_name_idx"),
+            models.Index(fields=["email"], name="employee_email_idx"),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(contact__regex=r"^[0-9]{1,15}$"),
+                name="employee_contact_15digits",
+                violation_error_code="invalid_contact",
+                violation_error_message="Contact must be 1 to 15 digits.",
+            ),
+        ]
     
\ No newline at end of file
@@ -0,0 +1,14 @@
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Employee
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def clear_employee_pages(sender, **kwargs):
+    # The list and detail pages are cached with cache_page, so drop them all.
+    # Wait for the commit, otherwise a GET in between re-caches the old rows.
+    transaction.on_commit(caches["employees"].clear)
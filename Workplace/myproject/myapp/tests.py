@@ -1,3 +1,87 @@
+import json
+
+from django.core.cache import caches
 from django.test import TestCase
+from django.urls import reverse
+
+from .models import Employee, Logger
+
+
+class BulkLogViewTests(TestCase):
+    def post_json(self, body):
+        return self.client.post(reverse("bulk_log"), body, content_type="application/json")
+
+    def test_creates_rows(self):
+        rows = [
+            {"first_name": "Ada", "last_name": "Lovelace", "time_log": "09:00"},
+            {"first_name": "Alan", "last_name": "Turing", "time_log": "10:30"},
+        ]
+        response = self.post_json(json.dumps(rows))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {"created": 2})
+        self.assertEqual(Logger.objects.count(), 2)
+
+    def test_rejects_non_array(self):
+        response = self.post_json(json.dumps({"first_name": "Ada"}))
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejects_invalid_json(self):
+        response = self.post_json("not json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_reports_bad_row(self):
+        rows = [
+            {"first_name": "Ada", "last_name": "Lovelace", "time_log": "09:00"},
+            {"first_name": "Alan", "last_name": "Turing", "time_log": "late"},
+        ]
+        response = self.post_json(json.dumps(rows))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["row"], 1)
+        self.assertIn("time_log", response.json()["errors"])
+        self.assertEqual(Logger.objects.count(), 0)
+
+
+class DrinksViewTests(TestCase):
+    def test_known_drink(self):
+        response = self.client.get(reverse("drinks", args=["tea"]))
+        self.assertContains(response, "type of beverage")
+
+    def test_unknown_drink_is_404(self):
+        response = self.client.get(reverse("drinks", args=["water"]))
+        self.assertEqual(response.status_code, 404)
+
+
+class EmployeeViewTests(TestCase):
+    def setUp(self):
+        caches["employees"].clear()
+
+    def test_delete_get_not_allowed(self):
+        employee = Employee.objects.create(name="Ada", email="ada@example.com", contact="0123")
+        response = self.client.get(reverse("EmployeeDelete", args=[employee.pk]))
+        self.assertEqual(response.status_code, 405)
+        self.assertTrue(Employee.objects.filter(pk=employee.pk).exists())
+
+    def test_delete_missing_is_404(self):
+        response = self.client.post(reverse("EmployeeDelete", args=[999]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete(self):
+        employee = Employee.objects.create(name="Ada", email="ada@example.com", contact="0123")
+        response = self.client.post(reverse("EmployeeDelete", args=[employee.pk]))
+        self.assertRedirects(response, reverse("employee_list"))
+        self.assertFalse(Employee.objects.filter(pk=employee.pk).exists())
+
+    def test_list_shows_new_employee_after_create(self):
+        # Prime the cached list page before the write
+        self.assertNotContains(self.client.get(reverse("employee_list")), "Ada")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("EmployeeCreate"),
+                {"name": "Ada", "email": "ada@example.com", "contact": "0123"},
+            )
+        self.assertRedirects(response, reverse("employee_list"))
 
-# Create your tests here.
+        response = self.client.get(reverse("employee_list"))
+        self.assertContains(response, "Ada")
+        self.assertContains(response, "0123")
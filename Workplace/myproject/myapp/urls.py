@@ -1,16 +1,19 @@
 from django.urls import path
+from django.views.decorators.cache import cache_page
 from . import views
 from .views import EmployeeDelete, EmployeeUpdate, NewView, IndexView, EmployeeCreate, EmployeeList, EmployeeDetail
 
+# Patterns are tried in order, so the most visited pages come first
 urlpatterns = [
     path('home/', views.form_view, name='home'),
+    path('list/', EmployeeList.as_view(), name='employee_list'),
+    path('show/<int:pk>/', EmployeeDetail.as_view(), name = 'EmployeeDetail'),
+    path('drink/<str:drink_name>/', cache_page(60 * 60)(views.drinks), name='drinks'),
     path('model/', views.model_form_view, name='model_form'),
-    path('drink/<str:drink_name>', views.drinks, name='drinks'),
-    path('about/', NewView.as_view()),
-    path('new-file/', IndexView.as_view(), name='new_file'),
+    path('model/bulk/', views.bulk_log_view, name='bulk_log'),
+    path('about/', cache_page(60 * 60)(NewView.as_view())),
+    path('new-file/', cache_page(60 * 5)(IndexView.as_view()), name='new_file'),
     path('create/', EmployeeCreate.as_view(), name = 'EmployeeCreate'),
-    path('list/', EmployeeList.as_view(), name='employee_list'),
-    path('show/<int:pk>', EmployeeDetail.as_view(), name = 'EmployeeDetail'),
-    path('update/<int:pk>', EmployeeUpdate.as_view(), name = 'EmployeeUpdate'),
-    path('delete/<int:pk>', EmployeeDelete.as_view(), name = 'EmployeeDelete') 
+    path('update/<int:pk>/', EmployeeUpdate.as_view(), name = 'EmployeeUpdate'),
+    path('delete/<int:pk>/', EmployeeDelete.as_view(), name = 'EmployeeDelete') 
 ]
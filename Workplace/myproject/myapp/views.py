@@ -1,27 +1,40 @@
-from django.http import HttpResponse
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from django.db import transaction
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, HttpResponseNotFound, HttpResponseRedirect, JsonResponse
 from django.views import View
 from django.shortcuts import render
+from django.urls import reverse_lazy
 from django.views.generic.base import TemplateView
 from django.views.generic.edit import CreateView
 from django.views.generic.list import ListView
 from django.views.generic.detail import DetailView
-from myapp.forms import InputForm, LogForm
-from myapp.models import Employee
+from myapp.forms import EmployeeForm, InputForm, LogForm
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import require_POST
+from myapp.models import Employee, Logger
+
+# Dictionary of drink types
+DRINKS = {
+    'mocha': 'type of coffee',
+    'tea': 'type of beverage',
+    'lemonade': 'type of refreshment',
+}
+
+# Response bodies are built once at import, keyed by drink_name
+_DRINK_HTML = MappingProxyType({
+    name: f"<h2>{name}</h2><p>{description}</p>".encode("utf-8")
+    for name, description in DRINKS.items()
+})
 
 # Create your views here.
 def drinks(request, drink_name):
-    # Dictionary of drink types
-    drink = {
-        'mocha': 'type of coffee',
-        'tea': 'type of beverage',
-        'lemonade': 'type of refreshment',
-    }
-    
-    # Get the description of the drink using drink_name
-    choice_of_drink = drink[drink_name]
-    
-    # Return an HTTP response with the drink name and description
-    return HttpResponse(f"<h2>{drink_name}</h2><p>{choice_of_drink}</p>")
+    body = _DRINK_HTML.get(drink_name)
+    if body is None:
+        return HttpResponseNotFound()
+    return HttpResponse(body)
 
 def home(request):
     return HttpResponse("HomePage")
@@ -31,15 +44,43 @@ def form_view(request):
     context = {"form": form}
     return render(request, "home.html", context)
 
+@lru_cache(maxsize=None)
+def _unbound_logform_html():
+    # An unbound LogForm always renders the same markup, so build it once
+    return LogForm().as_p()
+
 def model_form_view(request):
-    form = LogForm()
-    if request.method == 'POST':
-        form = LogForm(request.POST)
-        if form.is_valid():
+    if request.method != 'POST':
+        return render(request, "model.html", {"form_html": _unbound_logform_html()})
+    form = LogForm(request.POST)
+    if form.is_valid():
+        with transaction.atomic():
             form.save()
     context = {"form": form}
     return render(request, "model.html", context)
 
+@require_POST
+def bulk_log_view(request):
+    try:
+        rows = json.loads(request.body)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid JSON")
+    if not isinstance(rows, list):
+        return HttpResponseBadRequest("Expected a JSON array")
+
+    validated_rows = []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            return HttpResponseBadRequest("Expected a JSON array of objects")
+        form = LogForm(row)
+        if not form.is_valid():
+            return JsonResponse({"row": index, "errors": form.errors}, status=400)
+        validated_rows.append(form.cleaned_data)
+
+    with transaction.atomic():
+        logs = Logger.bulk_log(validated_rows)
+    return JsonResponse({"created": len(logs)}, status=201)
+
 
 # Class Generic views
 
@@ -51,34 +92,53 @@ class NewView(View):
 class IndexView(TemplateView): 
     template_name = 'new_file.html' 
 
+@method_decorator(transaction.atomic, name="post")
 class EmployeeCreate(CreateView):
     model = Employee
-    fields = '__all__'
-    success_url = "/demo/create/"
+    form_class = EmployeeForm
+    success_url = reverse_lazy("employee_list")
     template_name = 'myapp/employeeCreate.html'
 
 
+@method_decorator(cache_page(30, cache="employees"), name="dispatch")
 class EmployeeList(ListView):
     model = Employee
+    # plain dict rows of only the columns employee_list.html renders,
+    # a page at a time, so no model instances are built
+    queryset = Employee.objects.values("id", "name", "email", "contact").order_by("pk")
+    paginate_by = 50
+    context_object_name = "employees"
     success_url = "/employees/success/"
     template_name = 'myapp/employee_list.html'
 
+@method_decorator(cache_page(30, cache="employees"), name="dispatch")
 class EmployeeDetail(DetailView):
     model = Employee
     template_name = 'myapp/employee_detail.html'
 
 from django.views.generic.edit import UpdateView  
+@method_decorator(transaction.atomic, name="post")
 class EmployeeUpdate(UpdateView):   
     model = Employee   
-    fields = '__all__'   
-    success_url = "/employees/success/" 
+    form_class = EmployeeForm
+    success_url = reverse_lazy("employee_list")
     template_name = 'myapp/employee_update_form.html'
 
-from django.views.generic.edit import DeleteView 
-class EmployeeDelete(DeleteView):   
-    model = Employee   
-    success_url = "/employees/success/"
-    template_name = 'myapp/employee_confirm_delete.html'
+class EmployeeDelete(View):   
+    # No confirmation page, deletes are POSTed straight from the update page
+    http_method_names = ["post"]
+    success_url = reverse_lazy("employee_list")
+
+    @method_decorator(transaction.atomic)
+    def post(self, request, pk):
+        # Delete by pk without a separate get_object() lookup. The
+        # post_delete receiver in signals.py still makes Django SELECT the
+        # row before the DELETE.
+        deleted, _ = Employee.objects.filter(pk=pk).delete()
+        if not deleted:
+            raise Http404("No Employee matches the given query.")
+        return HttpResponseRedirect(self.success_url)
+
 
 
     
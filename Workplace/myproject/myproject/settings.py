@@ -78,10 +78,34 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Reuse connections across requests instead of reconnecting each time
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        # Only writer views open a transaction, see myapp/views.py
+        'ATOMIC_REQUESTS': False,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Cached Employee pages, cleared whenever an Employee changes. clear()
+    # empties the whole store, so this alias must never share it with other
+    # data (e.g. give it its own Redis database). LocMemCache is per
+    # process: with several workers, the others serve stale pages until
+    # the 30s timeout.
+    'employees': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'employees',
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 